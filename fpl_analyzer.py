@@ -1,9 +1,182 @@
 import pandas as pd
 import numpy as np
 import requests
-from typing import List, Dict, Optional, Union
-import warnings
-warnings.filterwarnings('ignore')
+import sys
+from pathlib import Path
+from typing import List, Dict, Optional, Set, Tuple, Union
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; scoring falls back to the NumPy matmul
+    _HAS_NUMBA = False
+
+# Position-specific scoring weights from FPL system, shared by all analyzers
+_POSITION_WEIGHTS = {
+    'FW': {  # Forward
+        'goals': 9,
+        'assists': 6,
+        'shots_on_target': 2,
+        'key_passes': 2,
+        'successful_dribbles': 1,
+        'accurate_crosses': 1,
+        'yellow_cards': -2,
+        'red_cards': -7,
+        'aerials_won': 0.5,
+        'effective_clearances': 0.15,
+        'saves': 2,
+        'smothers': 1,
+        'clean_sheets': 0.25,
+        'tackles_won': 1,
+        'penalty_kicks_drawn': 2,
+        'penalty_kicks_missed': -4,
+        'own_goals': -5,
+        'dispossessed': -0.5,
+        'blocked_shots': 1,
+        'goals_against': -0.15,
+        'interceptions': 1,
+        'penalty_saves': 8,
+        'high_claims': 1
+    },
+    'MF': {  # Midfielder
+        'goals': 9,
+        'assists': 6,
+        'shots_on_target': 2,
+        'key_passes': 2,
+        'successful_dribbles': 1,
+        'accurate_crosses': 1,
+        'tackles_won': 1,
+        'interceptions': 1,
+        'yellow_cards': -2,
+        'red_cards': -7,
+        'clean_sheets': 0.75,
+        'saves': 2,
+        'smothers': 1,
+        'effective_clearances': 0.25,
+        'aerials_won': 0.5,
+        'penalty_kicks_drawn': 2,
+        'own_goals': -5,
+        'dispossessed': -0.5,
+        'blocked_shots': 1,
+        'goals_against': -1,
+        'penalty_kicks_missed': -4,
+        'penalty_saves': 8,
+        'high_claims': 1
+    },
+    'DF': {  # Defender
+        'goals': 10,
+        'assists': 7,
+        'goals_against': -2,
+        'tackles_won': 1,
+        'interceptions': 1,
+        'yellow_cards': -2,
+        'red_cards': -7,
+        'clean_sheets': 4,
+        'shots_on_target': 2,
+        'saves': 2,
+        'penalty_kicks_drawn': 2,
+        'smothers': 1,
+        'key_passes': 2,
+        'successful_dribbles': 1,
+        'aerials_won': 1,
+        'blocked_shots': 1,
+        'effective_clearances': 0.25,
+        'own_goals': -5,
+        'dispossessed': -0.5,
+        'penalty_saves': 8,
+        'penalty_kicks_missed': -4,
+        'accurate_crosses': 1,
+        'high_claims': 1
+    },
+    'GK': {  # Goalkeeper
+        'goals_against': -2,
+        'clean_sheets': 3,
+        'saves': 2,
+        'high_claims': 1,
+        'smothers': 1,
+        'yellow_cards': -2,
+        'red_cards': -7,
+        'shots_on_target': 2,
+        'tackles_won': 1,
+        'key_passes': 2,
+        'clean_sheets_full_game': 5,
+        'penalty_kicks_missed': -4,
+        'assists': 7,
+        'penalty_kicks_drawn': 2,
+        'dispossessed': -0.5,
+        'aerials_won': 1,
+        'blocked_shots': 1,
+        'effective_clearances': 0.25,
+        'successful_dribbles': 1,
+        'goals': 10,
+        'penalty_saves': 8,
+        'own_goals': -5,
+        'interceptions': 1,
+        'accurate_crosses': 1
+    }
+}
+
+_PREMIER_LEAGUE_TEAMS = (
+    'Arsenal', 'Aston Villa', 'Bournemouth', 'Brentford', 'Brighton',
+    'Burnley', 'Chelsea', 'Crystal Palace', 'Everton', 'Fulham',
+    'Liverpool', 'Luton', 'Manchester City', 'Manchester Utd', 'Newcastle Utd',
+    'Nottingham Forest', 'Sheffield Utd', 'Tottenham', 'West Ham', 'Wolves'
+)
+
+# Row of each position in the dense weight matrix
+POS_CODES = {'FW': 0, 'MF': 1, 'DF': 2, 'GK': 3}
+
+def _build_weight_matrix(position_weights: Dict) -> Tuple[List[str], np.ndarray]:
+    """
+    Compile the weight dicts into a dense (position, stat) matrix
+    
+    Rows follow POS_CODES and columns follow the returned sorted stat names;
+    stats a position does not score get a weight of zero.
+    """
+    all_stats = set().union(*(weights.keys() for weights in position_weights.values()))
+    stat_names = sorted(sys.intern(stat) for stat in all_stats)
+    stat_index = {stat: i for i, stat in enumerate(stat_names)}
+    
+    matrix = np.zeros((len(POS_CODES), len(stat_names)), dtype=np.float32)
+    for position, weights in position_weights.items():
+        for stat, weight in weights.items():
+            matrix[POS_CODES[position], stat_index[stat]] = weight
+            
+    return stat_names, matrix
+
+STAT_NAMES, WEIGHTS = _build_weight_matrix(_POSITION_WEIGHTS)
+WEIGHTS.flags.writeable = False
+
+def _slim_weights(row: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Column indices and weights of the non-zero entries of a weight row"""
+    idx = np.flatnonzero(np.abs(row) > 1e-6)
+    return idx, row[idx]
+
+# Per-position weights restricted to the stats that position actually scores
+_POS_SLIM = {position: _slim_weights(WEIGHTS[code]) for position, code in POS_CODES.items()}
+
+# Count columns are small non-negative integers, so int16 (int32 for minutes) is plenty
+_INT16_STAT_COLS = [
+    'goals', 'assists', 'shots_on_target', 'key_passes', 'successful_dribbles',
+    'tackles_won', 'interceptions', 'clean_sheets', 'yellow_cards', 'red_cards',
+    'games_played'
+]
+
+# Candidate pools larger than this are scored by the JIT kernel when numba is available
+_JIT_MIN_ROWS = 256
+
+if _HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _score_kernel(mat, w, games):
+        """Weighted stat sum per row, projected to a full season"""
+        n, k = mat.shape
+        out = np.empty(n, dtype=np.float32)
+        for i in range(n):
+            s = 0.0
+            for j in range(k):
+                s += mat[i, j] * w[j]
+            out[i] = s * (38.0 / games[i]) if games[i] > 0 else s
+        return out
 
 class FPLPlayerAnalyzer:
     """
@@ -14,158 +187,103 @@ class FPLPlayerAnalyzer:
     """
     
     def __init__(self):
-        self.position_weights = self._initialize_position_weights()
-        self.premier_league_teams = [
-            'Arsenal', 'Aston Villa', 'Bournemouth', 'Brentford', 'Brighton',
-            'Burnley', 'Chelsea', 'Crystal Palace', 'Everton', 'Fulham',
-            'Liverpool', 'Luton', 'Manchester City', 'Manchester Utd', 'Newcastle Utd',
-            'Nottingham Forest', 'Sheffield Utd', 'Tottenham', 'West Ham', 'Wolves'
-        ]
-        self.taken_players = []
-        
-    def _initialize_position_weights(self) -> Dict:
-        """Initialize position-specific scoring weights from FPL system"""
-        return {
-            'FW': {  # Forward
-                'goals': 9,
-                'assists': 6,
-                'shots_on_target': 2,
-                'key_passes': 2,
-                'successful_dribbles': 1,
-                'accurate_crosses': 1,
-                'yellow_cards': -2,
-                'red_cards': -7,
-                'aerials_won': 0.5,
-                'effective_clearances': 0.15,
-                'saves': 2,
-                'smothers': 1,
-                'clean_sheets': 0.25,
-                'tackles_won': 1,
-                'penalty_kicks_drawn': 2,
-                'penalty_kicks_missed': -4,
-                'own_goals': -5,
-                'dispossessed': -0.5,
-                'blocked_shots': 1,
-                'goals_against': -0.15,
-                'interceptions': 1,
-                'penalty_saves': 8,
-                'high_claims': 1
-            },
-            'MF': {  # Midfielder
-                'goals': 9,
-                'assists': 6,
-                'shots_on_target': 2,
-                'key_passes': 2,
-                'successful_dribbles': 1,
-                'accurate_crosses': 1,
-                'tackles_won': 1,
-                'interceptions': 1,
-                'yellow_cards': -2,
-                'red_cards': -7,
-                'clean_sheets': 0.75,
-                'saves': 2,
-                'smothers': 1,
-                'effective_clearances': 0.25,
-                'aerials_won': 0.5,
-                'penalty_kicks_drawn': 2,
-                'own_goals': -5,
-                'dispossessed': -0.5,
-                'blocked_shots': 1,
-                'goals_against': -1,
-                'penalty_kicks_missed': -4,
-                'penalty_saves': 8,
-                'high_claims': 1
-            },
-            'DF': {  # Defender
-                'goals': 10,
-                'assists': 7,
-                'goals_against': -2,
-                'tackles_won': 1,
-                'interceptions': 1,
-                'yellow_cards': -2,
-                'red_cards': -7,
-                'clean_sheets': 4,
-                'shots_on_target': 2,
-                'saves': 2,
-                'penalty_kicks_drawn': 2,
-                'smothers': 1,
-                'key_passes': 2,
-                'successful_dribbles': 1,
-                'aerials_won': 1,
-                'blocked_shots': 1,
-                'effective_clearances': 0.25,
-                'own_goals': -5,
-                'dispossessed': -0.5,
-                'penalty_saves': 8,
-                'penalty_kicks_missed': -4,
-                'accurate_crosses': 1,
-                'high_claims': 1
-            },
-            'GK': {  # Goalkeeper
-                'goals_against': -2,
-                'clean_sheets': 3,
-                'saves': 2,
-                'high_claims': 1,
-                'smothers': 1,
-                'yellow_cards': -2,
-                'red_cards': -7,
-                'shots_on_target': 2,
-                'tackles_won': 1,
-                'key_passes': 2,
-                'clean_sheets_full_game': 5,
-                'penalty_kicks_missed': -4,
-                'assists': 7,
-                'penalty_kicks_drawn': 2,
-                'dispossessed': -0.5,
-                'aerials_won': 1,
-                'blocked_shots': 1,
-                'effective_clearances': 0.25,
-                'successful_dribbles': 1,
-                'goals': 10,
-                'penalty_saves': 8,
-                'own_goals': -5,
-                'interceptions': 1,
-                'accurate_crosses': 1
-            }
-        }
-    
+        self.position_weights = _POSITION_WEIGHTS
+        self.premier_league_teams = _PREMIER_LEAGUE_TEAMS
+        self.taken_players: Set[str] = set()
+        
+        # Cached player data and its columnar NumPy form (see refresh())
+        self._data_cache: Optional[pd.DataFrame] = None
+        self._raw: Optional[Dict[str, np.ndarray]] = None
+        
+        # Per-team aggregates and best player, built in one group-by pass
+        self._team_stats_cache: Optional[Dict[str, Dict]] = None
+        
+        # Taken flags aligned to the player category codes of the cached data
+        self._player_to_code: Dict[str, int] = {}
+        self._taken_mask = np.zeros(0, dtype=bool)
+        
     def fetch_fbref_data(self, league_id: str = 'eng-premier-league', season: str = '2024-2025') -> Optional[pd.DataFrame]:
         """
         Fetch player data from FBRef using worldfootballR-style endpoints
         
+        The whole league is pulled in a single request and the prepared frame
+        is cached as Parquet under ~/.fpl_cache, keyed by league and season, so
+        repeat draft sessions load from disk. The fetched data replaces the
+        sample data for all subsequent queries.
+        
         Args:
             league_id: League identifier (default: eng-premier-league)
             season: Season year (default: 2024-2025)
         """
+        cache_path = Path(f'~/.fpl_cache/{league_id}_{season}.parquet').expanduser()
+        
         try:
-            # This would typically use the worldfootballR API or similar
-            # For demonstration, using placeholder URL structure
-            base_url = "https://fbrapi.com/api/players"
-            params = {
-                'league': league_id,
-                'season': season,
-                'format': 'json'
-            }
-            
-            # Note: You'll need to replace this with actual API calls
-            # response = requests.get(base_url, params=params)
-            # data = response.json()
+            if cache_path.exists():
+                df = pd.read_parquet(cache_path)
+            else:
+                # This would typically use the worldfootballR API or similar
+                # For demonstration, using placeholder URL structure
+                base_url = "https://fbrapi.com/api/players"
+                params = {
+                    'league': league_id,
+                    'season': season,
+                    'format': 'json'
+                }
+                
+                response = requests.get(base_url, params=params, timeout=30)
+                response.raise_for_status()
+                df = self._prepare_data(pd.json_normalize(response.json()['players']))
+                
+                # A failed cache write only costs the next session's warm start
+                try:
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    df.to_parquet(cache_path)
+                except (OSError, ImportError) as e:
+                    print(f"Could not cache data: {e}")
             
-            # For now, return sample structure
-            print("Note: Replace this with actual FBRef API call")
-            print("You can use the worldfootballR library or fbrapi.com")
-            
-            return None
+            self._data_cache = df
+            self._raw = None
+            self._team_stats_cache = None
+            return df
             
         except Exception as e:
             print(f"Error fetching data: {e}")
             return None
     
+    def _prepare_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the compact dtypes and derived per-game columns used for scoring
+        
+        Args:
+            df: Raw player statistics frame
+        """
+        for col in ['player', 'team', 'position']:
+            df[col] = df[col].astype('category')
+        int16_cols = [col for col in _INT16_STAT_COLS if col in df]
+        df[int16_cols] = df[int16_cols].astype(np.int16)
+        if 'minutes_played' in df:
+            df['minutes_played'] = df['minutes_played'].astype(np.int32)
+        
+        # Per-game rates are derived once here rather than on every query
+        gp = df['games_played'].to_numpy()
+        inv = np.divide(1.0, gp, out=np.zeros(len(gp)), where=gp > 0)
+        df['goals_per_game'] = df['goals'].to_numpy() * inv
+        df['assists_per_game'] = df['assists'].to_numpy() * inv
+        df['key_passes_per_game'] = df['key_passes'].to_numpy() * inv
+        
+        return df
+    
     def load_sample_data(self) -> pd.DataFrame:
         """
         Load sample player data for demonstration
         In practice, this would be replaced with real FBRef data
+        
+        The frame is built once and cached; fetch_fbref_data() replaces it with
+        real data and refresh() drops it so it is rebuilt from the samples.
         """
+        if self._data_cache is not None:
+            return self._data_cache
+        
         sample_data = {
             'player': ['Mohamed Salah', 'Bruno Fernandes', 'Virgil van Dijk', 'Alisson', 
                       'Harry Kane', 'Kevin De Bruyne', 'Ruben Dias', 'Jordan Pickford',
@@ -188,7 +306,16 @@ class FPLPlayerAnalyzer:
             'minutes_played': [3060, 2880, 3150, 3240, 3150, 2340, 2970, 3240, 3150, 2320, 3060, 2880]
         }
         
-        return pd.DataFrame(sample_data)
+        self._data_cache = self._prepare_data(pd.DataFrame(sample_data))
+        self._raw = None
+        self._team_stats_cache = None
+        return self._data_cache
+    
+    def refresh(self):
+        """Clear cached player data so the next query reloads it"""
+        self._data_cache = None
+        self._raw = None
+        self._team_stats_cache = None
     
     def calculate_fpl_score(self, player_data: pd.Series, position: str) -> float:
         """
@@ -198,22 +325,144 @@ class FPLPlayerAnalyzer:
             player_data: Player statistics series
             position: Player position (FW, MF, DF, GK)
         """
-        weights = self.position_weights[position]
-        score = 0
+        # Same weights and normalization as the batch path, without building a frame
+        vals = player_data.reindex(STAT_NAMES, fill_value=0).to_numpy(dtype=np.float32)
+        score = float(vals @ WEIGHTS[POS_CODES[position]])
         
-        for stat, weight in weights.items():
-            if stat in player_data:
-                score += player_data[stat] * weight
-        
-        # Normalize by games played if available
-        if 'games_played' in player_data and player_data['games_played'] > 0:
-            score = score * (38 / max(player_data['games_played'], 1))  # Normalize to full season
+        games = player_data.get('games_played', 0)
+        if games > 0:
+            score *= 38.0 / games  # Normalize to full season
             
         return score
     
+    def _stat_matrix(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extract the float32 stat matrix and games-played array used for scoring
+        
+        Args:
+            df: Player statistics frame
+        """
+        mat = df.reindex(columns=STAT_NAMES, fill_value=0).to_numpy(dtype=np.float32)
+        
+        # Missing games_played is treated as zero games, which leaves scores unscaled
+        if 'games_played' in df:
+            games = df['games_played'].to_numpy(dtype=np.float32)
+        else:
+            games = np.zeros(len(df), dtype=np.float32)
+            
+        return mat, games
+    
+    def _raw_data(self) -> Dict[str, np.ndarray]:
+        """
+        Columnar (structure-of-arrays) view of the cached dataset
+        
+        Holds one NumPy array per frame column plus category codes for player
+        and team, the POS_CODES row of each player's position, and the stat
+        matrix and games-played array used for scoring.
+        """
+        df = self.load_sample_data()
+        if self._raw is None:
+            raw = {col: df[col].to_numpy() for col in df.columns}
+            raw['player_code'] = df['player'].cat.codes.to_numpy()
+            raw['team_code'] = df['team'].cat.codes.to_numpy()
+            raw['position_code'] = df['position'].map(POS_CODES).to_numpy(dtype=np.intp)
+            raw['stat_mat'], raw['games'] = self._stat_matrix(df)
+            self._raw = raw
+            
+            self._player_to_code = {name: i for i, name in enumerate(df['player'].cat.categories)}
+            self._taken_mask = np.zeros(len(self._player_to_code), dtype=bool)
+            self._mark_taken(self.taken_players)
+            
+            if _HAS_NUMBA:
+                # Compile (or load the cached build of) the kernel outside the query path
+                idx, weights = _POS_SLIM['FW']
+                _score_kernel(raw['stat_mat'][:, idx], weights, raw['games'])
+        return self._raw
+    
+    def _frame_from_raw(self, rows: np.ndarray, columns: List[str], **computed: np.ndarray) -> pd.DataFrame:
+        """
+        Materialize selected rows of the columnar data as a DataFrame
+        
+        Args:
+            rows: Positional row indices into the cached dataset
+            columns: Output columns, in order
+            computed: Arrays aligned to rows for columns not stored in the data
+        """
+        raw = self._raw_data()
+        data = {col: computed[col] if col in computed else raw[col][rows] for col in columns}
+        return pd.DataFrame(data, index=self.load_sample_data().index[rows])
+    
+    def _season_scale(self, games: np.ndarray) -> np.ndarray:
+        """Factor projecting per-game output to a full season, 1 for players with no games"""
+        return np.divide(38.0, games, out=np.ones_like(games), where=games > 0)
+    
+    def _score_matrix(self, mat: np.ndarray, games: np.ndarray, position: str,
+                      rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Apply position weights to a stat matrix and normalize to a full season
+        
+        Only the columns the position actually scores are gathered, together
+        with the requested rows when given, so zero-weight stats are never read.
+        """
+        idx, weights = _POS_SLIM[position]
+        if rows is None:
+            sub = mat[:, idx]
+        else:
+            sub, games = mat[np.ix_(rows, idx)], games[rows]
+            
+        if _HAS_NUMBA and sub.shape[0] > _JIT_MIN_ROWS:
+            return _score_kernel(sub, weights, games)
+        
+        scores = sub @ weights
+        return scores * self._season_scale(games)
+    
+    def _score_frame(self, df: pd.DataFrame, position: str) -> np.ndarray:
+        """
+        Vectorized FPL score for every row of df, scored as the given position
+        
+        Args:
+            df: Player statistics frame
+            position: Position whose weights to apply (FW, MF, DF, GK)
+        """
+        mat, games = self._stat_matrix(df)
+        return self._score_matrix(mat, games, position)
+    
+    def _score_mixed_matrix(self, mat: np.ndarray, games: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """
+        Score rows of mixed positions in one matmul
+        
+        Every row is scored against all position weights and the column
+        matching the row's own POS_CODES entry is kept.
+        """
+        all_scores = mat @ WEIGHTS.T
+        scores = all_scores[np.arange(len(codes)), codes]
+        return scores * self._season_scale(games)
+    
+    def _score_mixed(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Vectorized FPL score for a frame holding players of several positions
+        
+        Args:
+            df: Player statistics frame with a 'position' column
+        """
+        mat, games = self._stat_matrix(df)
+        codes = df['position'].map(POS_CODES).to_numpy(dtype=np.intp)
+        return self._score_mixed_matrix(mat, games, codes)
+    
+    def _category_codes(self, column: pd.Series, values) -> np.ndarray:
+        """Category codes of the given values, dropping values not in the column"""
+        codes = column.cat.categories.get_indexer(list(values))
+        return codes[codes >= 0]
+    
+    def _mark_taken(self, players):
+        """Flip the taken flags of players present in the cached data"""
+        codes = [self._player_to_code[p] for p in players if p in self._player_to_code]
+        self._taken_mask[codes] = True
+    
     def add_taken_players(self, players: List[str]):
         """Add players that have been taken in the draft"""
-        self.taken_players.extend(players)
+        self.taken_players.update(players)
+        self._mark_taken(players)
         print(f"Added {len(players)} players to taken list. Total taken: {len(self.taken_players)}")
     
     def suggest_players(self, position: str, num_suggestions: int = 5, 
@@ -228,35 +477,43 @@ class FPLPlayerAnalyzer:
         """
         # Load data (in practice, this would be real FBRef data)
         df = self.load_sample_data()
+        raw = self._raw_data()
         
-        if exclude_teams is None:
-            exclude_teams = []
+        exclude_teams = set(exclude_teams or ())
         
-        # Filter by position and availability
-        available_players = df[
-            (df['position'] == position) & 
-            (~df['player'].isin(self.taken_players)) &
-            (~df['team'].isin(exclude_teams))
-        ].copy()
+        # Filter by position and availability as one boolean array over code arrays
+        mask = raw['position_code'] == POS_CODES.get(position, -1)
+        mask &= ~self._taken_mask[raw['player_code']]
+        if exclude_teams:
+            team_codes = self._category_codes(df['team'], exclude_teams)
+            mask &= ~np.isin(raw['team_code'], team_codes)
+        rows = np.flatnonzero(mask)
         
-        if available_players.empty:
+        if rows.size == 0:
             print(f"No available players found for position {position}")
             return pd.DataFrame()
         
-        # Calculate FPL scores
-        available_players['fpl_score'] = available_players.apply(
-            lambda row: self.calculate_fpl_score(row, position), axis=1
-        )
-        
-        # Add per-game averages
-        available_players['goals_per_game'] = available_players['goals'] / available_players['games_played']
-        available_players['assists_per_game'] = available_players['assists'] / available_players['games_played']
+        # Calculate FPL scores straight from the cached stat matrix
+        scores = self._score_matrix(raw['stat_mat'], raw['games'], position, rows)
         
-        # Sort by FPL score and return top suggestions
-        suggestions = available_players.nlargest(num_suggestions, 'fpl_score')
+        # Select the top suggestions with a partial sort, then order just those
+        k = min(max(num_suggestions, 0), scores.size)
+        if 0 < k < scores.size:
+            # Everything above the k-th score, then the earliest rows tied with it, as nlargest does
+            thr = np.partition(scores, scores.size - k)[scores.size - k]
+            above = np.flatnonzero(scores > thr)
+            tied = np.flatnonzero(scores == thr)[:k - above.size]
+            idx = np.sort(np.concatenate([above, tied]))
+        else:
+            idx = np.arange(k)
+        idx = idx[np.argsort(-scores[idx], kind='stable')]
         
-        return suggestions[['player', 'team', 'position', 'fpl_score', 'goals', 'assists', 
-                          'goals_per_game', 'assists_per_game', 'games_played']]
+        return self._frame_from_raw(
+            rows[idx],
+            ['player', 'team', 'position', 'fpl_score', 'goals', 'assists',
+             'goals_per_game', 'assists_per_game', 'games_played'],
+            fpl_score=scores[idx]
+        )
     
     def compare_players(self, player_names: List[str]) -> pd.DataFrame:
         """
@@ -266,24 +523,24 @@ class FPLPlayerAnalyzer:
             player_names: List of player names to compare
         """
         df = self.load_sample_data()
+        raw = self._raw_data()
         
-        comparison_players = df[df['player'].isin(player_names)].copy()
+        name_codes = self._category_codes(df['player'], player_names)
+        rows = np.flatnonzero(np.isin(raw['player_code'], name_codes))
         
-        if comparison_players.empty:
+        if rows.size == 0:
             print("No players found for comparison")
             return pd.DataFrame()
         
         # Calculate FPL scores for each
-        for idx, row in comparison_players.iterrows():
-            comparison_players.at[idx, 'fpl_score'] = self.calculate_fpl_score(row, row['position'])
-        
-        # Add relevant per-game stats
-        comparison_players['goals_per_game'] = comparison_players['goals'] / comparison_players['games_played']
-        comparison_players['assists_per_game'] = comparison_players['assists'] / comparison_players['games_played']
-        comparison_players['key_passes_per_game'] = comparison_players['key_passes'] / comparison_players['games_played']
+        scores = self._score_mixed_matrix(raw['stat_mat'][rows], raw['games'][rows], raw['position_code'][rows])
         
-        return comparison_players[['player', 'team', 'position', 'fpl_score', 'goals_per_game', 
-                                 'assists_per_game', 'key_passes_per_game', 'tackles_won', 'clean_sheets']]
+        return self._frame_from_raw(
+            rows,
+            ['player', 'team', 'position', 'fpl_score', 'goals_per_game',
+             'assists_per_game', 'key_passes_per_game', 'tackles_won', 'clean_sheets'],
+            fpl_score=scores
+        )
     
     def team_analysis(self, team_name: str) -> Dict:
         """
@@ -292,35 +549,54 @@ class FPLPlayerAnalyzer:
         Args:
             team_name: Name of the team to analyze
         """
-        df = self.load_sample_data()
-        team_players = df[df['team'] == team_name]
+        team_stats = self._team_stats()
         
-        if team_players.empty:
+        if team_name not in team_stats:
             return {"error": f"No data found for team {team_name}"}
         
-        analysis = {
-            'team': team_name,
-            'total_players': len(team_players),
-            'avg_clean_sheets': team_players['clean_sheets'].mean(),
-            'total_goals': team_players['goals'].sum(),
-            'total_assists': team_players['assists'].sum(),
-            'best_fpl_player': None,
-            'positions_covered': team_players['position'].unique().tolist()
-        }
-        
-        # Find best FPL player
-        team_players_copy = team_players.copy()
-        for idx, row in team_players_copy.iterrows():
-            team_players_copy.at[idx, 'fpl_score'] = self.calculate_fpl_score(row, row['position'])
+        return {'team': team_name, **team_stats[team_name]}
+    
+    def _team_stats(self) -> Dict[str, Dict]:
+        """
+        Aggregates for every team, computed in one group-by over the cached data
         
-        best_player = team_players_copy.loc[team_players_copy['fpl_score'].idxmax()]
-        analysis['best_fpl_player'] = {
-            'name': best_player['player'],
-            'position': best_player['position'],
-            'fpl_score': best_player['fpl_score']
-        }
+        Each entry holds the team_analysis fields other than the team name.
+        """
+        df = self.load_sample_data()
+        raw = self._raw_data()
         
-        return analysis
+        if self._team_stats_cache is None:
+            teams = df['team']
+            
+            # Sum in int64 so the int16 count columns cannot overflow
+            counts = df[['clean_sheets', 'goals', 'assists']].astype(np.int64)
+            totals = counts.groupby(teams, observed=True).agg(
+                total_players=('goals', 'size'),
+                avg_clean_sheets=('clean_sheets', 'mean'),
+                total_goals=('goals', 'sum'),
+                total_assists=('assists', 'sum')
+            )
+            positions = df.groupby('team', observed=True)['position'].unique()
+            
+            # Score everyone once, then take each team's best row
+            scores = self._score_mixed_matrix(raw['stat_mat'], raw['games'], raw['position_code'])
+            best_rows = pd.Series(scores).groupby(teams.to_numpy()).idxmax()
+            
+            team_stats = {}
+            for team, stats in totals.to_dict('index').items():
+                best = best_rows[team]
+                team_stats[team] = {
+                    **stats,
+                    'best_fpl_player': {
+                        'name': raw['player'][best],
+                        'position': raw['position'][best],
+                        'fpl_score': scores[best]
+                    },
+                    'positions_covered': list(positions[team])
+                }
+            self._team_stats_cache = team_stats
+            
+        return self._team_stats_cache
     
     def get_draft_strategy(self, current_round: int, your_pick_position: int, 
                           total_teams: int = 12) -> Dict:
@@ -28,19 +28,68 @@ import pandas as pd
 import numpy as np
 import json
 import os
+import sys
+import glob
 from datetime import datetime
 import math
+import functools
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # orjson is optional; falls back to the stdlib json parser
+    _HAS_ORJSON = False
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; snake draft math runs as plain Python
+    _HAS_NUMBA = False
+
+POSITIONS = ('FW', 'MF', 'DF', 'GK')
+
+
+def _snake_pick(total_picks, your_pos, teams):
+    """Snake draft (round, current picker, picks until yours) for a pick count"""
+    rnd = total_picks // teams + 1
+    pick_in_round = total_picks % teams + 1
+    odd = rnd & 1
+    
+    # Odd rounds run 1..teams, even rounds run teams..1
+    current_picker = pick_in_round if odd else teams - pick_in_round + 1
+    
+    # Absolute (0-based) index of your pick this round; if it has passed, use next round's
+    your_abs = (rnd - 1) * teams + (your_pos if odd else teams - your_pos + 1) - 1
+    if your_abs < total_picks:
+        your_abs = rnd * teams + (teams - your_pos + 1 if odd else your_pos) - 1
+    
+    return rnd, current_picker, your_abs - total_picks
+
+
+if _HAS_NUMBA:
+    _snake_pick = njit(cache=True)(_snake_pick)
+
+
+def _intern(value):
+    """Intern strings so repeated names share one object; other values pass through"""
+    return sys.intern(value) if isinstance(value, str) else value
 
 class LiveDraftTool:
     def __init__(self):
-        self.taken_players = []
+        self.taken_players = set()
         self.draft_order = []
         self.current_round = 1
         self.your_position = 7  # Default to 7th pick as mentioned
         self.total_teams = 12   # Standard league size
         self.players_data = None
+        self.all_players = self._empty_player_table()
+        self.sorted = {}
+        self.name_index = {}
         self.analysis_data = None
         
+        # Compile (or load the cached build of) the pick kernel before the interactive loop
+        _snake_pick(0, 1, 1)
+        
         # Load pre-draft analysis if available
         self.load_analysis_data()
         
@@ -65,20 +114,25 @@ class LiveDraftTool:
     def load_analysis_data(self):
         """Load the pre-draft analysis data"""
         # Look for the most recent analysis file
-        analysis_files = [f for f in os.listdir('.') if f.startswith('fpl_draft_analysis_') and f.endswith('.json')]
+        analysis_files = glob.glob('fpl_draft_analysis_*.json')
         
         if analysis_files:
-            latest_file = sorted(analysis_files)[-1]
+            latest_file = max(analysis_files, key=os.path.getmtime)
             print(f"Loading analysis data from: {latest_file}")
             try:
-                with open(latest_file, 'r') as f:
-                    self.analysis_data = json.load(f)
+                if _HAS_ORJSON:
+                    with open(latest_file, 'rb') as f:
+                        self.analysis_data = orjson.loads(f.read())
+                else:
+                    with open(latest_file, 'r') as f:
+                        self.analysis_data = json.load(f)
                     
                 # Convert back to DataFrame format for easier handling
                 if 'top_players_by_position' in self.analysis_data:
                     self.players_data = {}
                     for pos, players in self.analysis_data['top_players_by_position'].items():
                         self.players_data[pos] = pd.DataFrame(players)
+                    self._build_player_table()
                         
                 print("✓ Analysis data loaded successfully")
             except Exception as e:
@@ -120,33 +174,70 @@ class LiveDraftTool:
             ])
         }
         self.players_data = sample_players
+        self._build_player_table()
+    
+    @staticmethod
+    def _empty_player_table():
+        """Player table with no rows, so searches and comparisons simply find nothing"""
+        return pd.DataFrame(columns=['name', 'team', 'position', 'name_lower'])
+    
+    def _build_player_table(self):
+        """Flatten the per-position frames into one table with a position column"""
+        positions = [pos for pos in POSITIONS if pos in self.players_data]
+        positions += [pos for pos in self.players_data if pos not in POSITIONS]
+        if not positions:
+            self.all_players = self._empty_player_table()
+            self.sorted = {}
+            self.name_index = {}
+            return
+        
+        # Pad stats a position doesn't track with 0, matching the .get(stat, 0) defaults
+        columns = list(dict.fromkeys(col for pos in positions for col in self.players_data[pos].columns))
+        frames = [self.players_data[pos].reindex(columns=columns, fill_value=0).assign(position=pos)
+                  for pos in positions]
+        all_players = pd.concat(frames, ignore_index=True)
+        all_players['position'] = pd.Categorical(all_players['position'], categories=positions)
+        all_players['name_lower'] = all_players['name'].str.casefold()
+        self.all_players = all_players
+        
+        # Best-first names, scores and records per position for suggestions
+        self.sorted = {}
+        for pos, frame in zip(positions, frames):
+            if 'fpl_score' in frame.columns:
+                frame = frame.sort_values('fpl_score', ascending=False, kind='stable')
+                scores = frame['fpl_score'].to_numpy(dtype=np.float32)
+            else:
+                scores = np.zeros(len(frame), dtype=np.float32)
+            records = frame.to_dict('records')
+            for row in records:
+                # Interned names/teams make the taken-set and dict lookups pointer compares
+                row['name'] = _intern(row['name'])
+                if 'team' in row:
+                    row['team'] = _intern(row['team'])
+            self.sorted[pos] = {
+                'names': np.array([row['name'] for row in records], dtype=object),
+                'scores': scores,
+                'records': records
+            }
+        
+        # Casefolded exact-name lookup across positions; the first position listed wins
+        self.name_index = {}
+        for pos in positions:
+            for row in self.sorted[pos]['records']:
+                if isinstance(row['name'], str):
+                    self.name_index.setdefault(sys.intern(row['name'].casefold()), (pos, row))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _calc(total_picks, your_pos, teams):
+        """Memoized snake draft position; see _snake_pick"""
+        return _snake_pick(int(total_picks), int(your_pos), int(teams))
     
     def calculate_current_pick(self):
         """Calculate whose pick it is in a snake draft"""
         total_picks_made = len(self.taken_players)
-        current_round = (total_picks_made // self.total_teams) + 1
-        pick_in_round = (total_picks_made % self.total_teams) + 1
-        
-        # Snake draft logic
-        if current_round % 2 == 1:  # Odd rounds (1, 3, 5, ...)
-            current_picker = pick_in_round
-        else:  # Even rounds (2, 4, 6, ...)
-            current_picker = self.total_teams - pick_in_round + 1
-        
-        # Calculate when your next pick is
-        picks_until_yours = 0
-        if current_picker <= self.your_position and current_round % 2 == 1:
-            picks_until_yours = self.your_position - current_picker
-        elif current_picker >= self.your_position and current_round % 2 == 0:
-            picks_until_yours = current_picker - self.your_position
-        else:
-            # Need to wait until next round
-            remaining_picks_this_round = self.total_teams - pick_in_round + 1
-            if current_round % 2 == 1:  # Currently odd, next will be even
-                next_round_position = self.total_teams - self.your_position + 1
-            else:  # Currently even, next will be odd
-                next_round_position = self.your_position
-            picks_until_yours = remaining_picks_this_round + next_round_position - 1
+        current_round, current_picker, picks_until_yours = self._calc(
+            total_picks_made, self.your_position, self.total_teams)
         
         return {
             'current_round': current_round,
@@ -157,8 +248,9 @@ class LiveDraftTool:
     
     def add_taken_player(self, player_name):
         """Add a player to the taken list"""
+        player_name = _intern(player_name)
         if player_name not in self.taken_players:
-            self.taken_players.append(player_name)
+            self.taken_players.add(player_name)
             print(f"✓ Added {player_name} to taken players list")
             
             # Update draft status
@@ -173,19 +265,20 @@ class LiveDraftTool:
         """Get available players for a position"""
         if not self.players_data or position not in self.players_data:
             print(f"No data available for position {position}")
-            return pd.DataFrame()
-        
-        pos_data = self.players_data[position].copy()
-        
-        # Filter out taken players
-        available = pos_data[~pos_data['name'].isin(self.taken_players)]
+            return []
+        
+        # First N untaken entries of the pre-sorted arrays
+        ranked = self.sorted[position]
+        if self.taken_players:
+            taken = np.array(list(self.taken_players), dtype=object)
+            mask = ~np.isin(ranked['names'], taken)
+            idx = np.flatnonzero(mask)[:num_suggestions]
+        else:
+            idx = range(min(num_suggestions, len(ranked['records'])))
+        top_available = [ranked['records'][i] for i in idx]
         
-        if available.empty:
+        if not top_available:
             print(f"No available players found for {position}")
-            return pd.DataFrame()
-        
-        # Sort by FPL score and return top suggestions
-        top_available = available.head(num_suggestions)
         return top_available
     
     def suggest_players(self, position, num_suggestions=8):
@@ -195,10 +288,10 @@ class LiveDraftTool:
         
         available = self.get_available_players(position, num_suggestions)
         
-        if available.empty:
+        if not available:
             return
         
-        for idx, (_, player) in enumerate(available.iterrows(), 1):
+        for idx, player in enumerate(available, 1):
             name = player['name']
             team = player['team']
             fpl_score = player.get('fpl_score', 0)
@@ -222,16 +315,17 @@ class LiveDraftTool:
         
         for player_name in player_names:
             player_info = None
+            needle = player_name.casefold()
             
-            # Search through all positions
-            for pos in ['FW', 'MF', 'DF', 'GK']:
-                if pos in self.players_data:
-                    pos_data = self.players_data[pos]
-                    matches = pos_data[pos_data['name'].str.contains(player_name, case=False, na=False)]
-                    if not matches.empty:
-                        player_info = matches.iloc[0].to_dict()
-                        player_info['position'] = pos
-                        break
+            # Try an exact name hit first, then one substring scan of the flat table
+            hit = self.name_index.get(needle)
+            if hit:
+                player_info = hit[1]
+            else:
+                players = self.all_players
+                matches = players[players['name_lower'].str.contains(needle, regex=False, na=False)]
+                if not matches.empty:
+                    player_info = matches.iloc[0].to_dict()
             
             if player_info:
                 comparison_data.append(player_info)
@@ -395,19 +489,18 @@ class LiveDraftTool:
         
         found_players = []
         
-        for pos in ['FW', 'MF', 'DF', 'GK']:
-            if pos in self.players_data:
-                pos_data = self.players_data[pos]
-                matches = pos_data[pos_data['name'].str.contains(search_term, case=False, na=False)]
-                
-                for _, player in matches.iterrows():
-                    taken_status = "❌ TAKEN" if player['name'] in self.taken_players else "✅ Available"
-                    fpl_score = player.get('fpl_score', 0)
-                    
-                    print(f"  {player['name']} ({player['team']}) - {pos}")
-                    print(f"    FPL Score: {fpl_score:.1f} | Status: {taken_status}")
-                    
-                    found_players.append(player['name'])
+        players = self.all_players
+        needle = search_term.casefold()
+        matches = players[players['name_lower'].str.contains(needle, regex=False, na=False)]
+        
+        for player in matches.itertuples(index=False):
+            taken_status = "❌ TAKEN" if player.name in self.taken_players else "✅ Available"
+            fpl_score = getattr(player, 'fpl_score', 0)
+            
+            print(f"  {player.name} ({player.team}) - {player.position}")
+            print(f"    FPL Score: {fpl_score:.1f} | Status: {taken_status}")
+            
+            found_players.append(player.name)
         
         if not found_players:
             print("  No players found matching that search term")
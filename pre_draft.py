@@ -20,12 +20,111 @@ Make sure to set your FBR API key:
 import pandas as pd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import os
 import json
+import time
+import functools
+from pathlib import Path
 from datetime import datetime
+from collections.abc import Mapping
+from types import MappingProxyType
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; scoring falls back to NumPy broadcasting
+    _HAS_NUMBA = False
+
+try:
+    import pyarrow as pa
+    _HAS_PYARROW = True
+except ImportError:  # pyarrow is optional; string columns keep the default dtype
+    _HAS_PYARROW = False
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # orjson is optional; falls back to the stdlib json encoder
+    _HAS_ORJSON = False
+
+# Fetched API responses are reused from disk for this long before revalidating
+_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Stats (raw and derived) held in the shared float32 matrix; weight stats are appended
+_STAT_COLUMNS = [
+    'goals', 'assists', 'apps', 'mins', 'shots_on_target', 'key_passes', 'tackles_won',
+    'interceptions', 'clean_sheets', 'saves', 'aerials_won', 'yellow_cards', 'red_cards',
+    'penalty_saves', 'penalty_goals', 'penalty_missed', 'own_goals', 'goals_against',
+    'goals_per_90', 'assists_per_90', 'goal_contributions', 'gc_per_90'
+]
+
+# Record layout of the offline sample players; stats some players lack are float so they can hold NaN
+PLAYER_DTYPE = np.dtype([
+    ('name', 'U40'), ('team', 'U40'), ('position', 'U2'),
+    ('goals', 'i4'), ('assists', 'i4'), ('apps', 'i4'), ('mins', 'i4'),
+    ('shots_on_target', 'f4'), ('key_passes', 'f4'), ('successful_dribbles', 'f4'),
+    ('yellow_cards', 'i4'), ('red_cards', 'i4'), ('clean_sheets', 'i4'),
+    ('tackles_won', 'f4'), ('interceptions', 'f4'), ('aerials_won', 'f4'),
+    ('saves', 'f4'), ('goals_conceded', 'f4'), ('penalty_saves', 'f4')
+])
+
+# Static round-by-round advice shared by every cheat sheet; read-only so callers can't mutate it
+_DRAFT_STRATEGY = MappingProxyType({
+    'rounds_1_3': (
+        "Target elite midfielders (Bruno, KDB, Saka)",
+        "Consider premium forwards (Haaland, Salah)",
+        "Avoid goalkeepers - wait until round 6+",
+        "Look for players with penalty duties"
+    ),
+    'rounds_4_6': (
+        "Fill midfielder positions with consistent scorers",
+        "Target defenders from top defensive teams",
+        "Consider your first goalkeeper here",
+        "Look for players with multiple category contributions"
+    ),
+    'rounds_7_plus': (
+        "Focus on upside picks and breakout candidates",
+        "Target newly promoted team standouts",
+        "Consider injury-prone players with high ceilings",
+        "Fill bench with players who could surprise"
+    )
+})
+
+# Below this many players the NumPy path beats the JIT kernel's thread start-up
+_JIT_MIN_ROWS = 256
+
+if _HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _score_all(X, safe_apps, W, pos):
+        """Weighted stat sum per player by position code, projected to a full season"""
+        n, k = X.shape
+        out = np.empty(n, dtype=np.float64)
+        for i in prange(n):
+            p = pos[i]
+            s = 0.0
+            if 0 <= p < W.shape[0]:
+                for j in range(k):
+                    s += X[i, j] * W[p, j]
+            out[i] = s / safe_apps[i] * 38
+        return out
+
+
+def _json_default(obj):
+    """Serialize the non-JSON values found in a cheat sheet"""
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict('records')
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if obj is pd.NA:
+        return None
+    return str(obj)
+
 class PreDraftAnalyzer:
     def __init__(self):
         self.api_key = os.getenv('FBRAPI_KEY')
@@ -34,7 +133,16 @@ class PreDraftAnalyzer:
             print("Set it with: export FBRAPI_KEY='your_api_key_here'")
         
         self.base_url = "https://api.fbrapi.com/v1"
+        
+        # One pooled session so the endpoint fetches share connections and TLS setup
+        self._session = requests.Session()
+        self._session.headers.update({
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        })
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
         self.position_weights = self._initialize_position_weights()
+        self.weight_matrix = self._build_weight_matrix(self.position_weights)
         self.premier_league_teams = [
             'Arsenal', 'Aston Villa', 'AFC Bournemouth', 'Brentford', 'Brighton & Hove Albion',
             'Burnley', 'Chelsea', 'Crystal Palace', 'Everton', 'Fulham',
@@ -46,6 +154,21 @@ class PreDraftAnalyzer:
         self.players_data = None
         self.team_data = None
         
+        # Players x stats matrix shared by scoring, value picks and team analysis
+        self._stat_columns = list(dict.fromkeys(_STAT_COLUMNS + list(self.weight_matrix.columns)))
+        self._col_index = {col: i for i, col in enumerate(self._stat_columns)}
+        self._weight_idx = [self._col_index[col] for col in self.weight_matrix.columns]
+        self._X = None
+        self._missing = None
+        self._safe_apps = None
+        self._X_source = None  # players_data frame the matrix was built from
+        
+        # Analysis results are memoized per data version, bumped whenever players_data changes
+        self._data_version = 0
+        self._rankings_cached = functools.lru_cache(maxsize=8)(self._compute_position_rankings)
+        self._value_picks_cached = functools.lru_cache(maxsize=8)(self._compute_value_picks)
+        self._team_stats_cached = functools.lru_cache(maxsize=8)(self._compute_team_analysis)
+        
     def _initialize_position_weights(self):
         """Initialize FPL scoring weights by position"""
         return {
@@ -74,10 +197,25 @@ class PreDraftAnalyzer:
             }
         }
     
+    def _build_weight_matrix(self, position_weights):
+        """Dense position x stat weight table, zero where a position ignores a stat"""
+        weights = pd.DataFrame.from_dict(position_weights, orient='index')
+        return weights.reindex(['FW', 'MF', 'DF', 'GK']).fillna(0).astype(np.float32)
+    
     def fetch_premier_league_data(self, season='2024-25'):
-        """Fetch current Premier League player data from FBR API"""
+        """
+        Fetch current Premier League player data from FBR API
+        
+        Returns the raw responses keyed by endpoint, or an empty dict when the cleaned
+        tables were restored from the warm-start cache and nothing was fetched.
+        """
         print(f"Fetching Premier League data for {season}...")
         
+        # Cleaned tables saved by a recent run skip fetching and processing entirely
+        if self._load_processed_cache(season):
+            print("✓ Loaded processed player data from cache")
+            return {}
+        
         # Example FBR API endpoints (adjust based on actual API documentation)
         endpoints = {
             'players': f"{self.base_url}/players/premier-league/{season}",
@@ -85,65 +223,172 @@ class PreDraftAnalyzer:
             'fixtures': f"{self.base_url}/fixtures/premier-league/{season}"
         }
         
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json'
-        }
-        
         all_data = {}
-        
-        for data_type, url in endpoints.items():
+        fallback_types = set()
+        
+        # Responses cached within the TTL are used as-is; older ones are revalidated
+        cached = {data_type: self._read_cache(season, data_type) for data_type in endpoints}
+        now = time.time()
+        fresh = {data_type for data_type, entry in cached.items()
+                 if entry and now - entry.get('fetched_at', 0) < _CACHE_TTL_SECONDS}
+        
+        # Issue the remaining requests concurrently, then handle the responses in endpoint order
+        stale = {data_type: url for data_type, url in endpoints.items() if data_type not in fresh}
+        futures = {}
+        if stale:
+            with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+                futures = {data_type: executor.submit(self._session.get, url, timeout=30,
+                                                      headers=self._revalidation_headers(cached[data_type]))
+                           for data_type, url in stale.items()}
+        
+        for data_type in endpoints:
+            if data_type in fresh:
+                all_data[data_type] = cached[data_type]['data']
+                print(f"✓ Loaded {data_type} from cache")
+                continue
+            
             try:
                 print(f"Fetching {data_type}...")
-                response = requests.get(url, headers=headers, timeout=30)
+                response = futures[data_type].result()
                 
-                if response.status_code == 200:
+                if response.status_code == 304 and cached[data_type]:
+                    entry = cached[data_type]
+                    all_data[data_type] = entry['data']
+                    self._write_cache(season, data_type, entry['data'], entry.get('etag'), entry.get('last_modified'))
+                    print(f"✓ {data_type} unchanged, using cached copy")
+                elif response.status_code == 200:
                     data = response.json()
                     all_data[data_type] = data
+                    self._write_cache(season, data_type, data, response.headers.get('ETag'),
+                                      response.headers.get('Last-Modified'))
                     print(f"✓ Successfully fetched {data_type}")
                 else:
                     print(f"✗ Error fetching {data_type}: {response.status_code}")
-                    # Fallback to sample data for demo
-                    all_data[data_type] = self._get_sample_data(data_type)
+                    all_data[data_type] = self._fallback_data(data_type, cached[data_type])
+                    fallback_types.add(data_type)
                     
             except requests.RequestException as e:
                 print(f"✗ Network error fetching {data_type}: {e}")
-                all_data[data_type] = self._get_sample_data(data_type)
+                all_data[data_type] = self._fallback_data(data_type, cached[data_type])
+                fallback_types.add(data_type)
         
         self._process_api_data(all_data)
+        # Only freshly confirmed player data is worth a warm start; fallbacks retry next run
+        if 'players' not in fallback_types:
+            self._write_processed_cache(season)
         return all_data
     
+    def _fallback_data(self, data_type, entry):
+        """Stale cached data when a refresh fails, or sample data for demo if nothing is cached"""
+        if entry:
+            print(f"⚠ Using stale cache for {data_type}")
+            return entry['data']
+        return self._get_sample_data(data_type)
+    
+    def _cache_path(self, season, data_type):
+        """On-disk location of a cached API response"""
+        return Path(f'~/.fpl_cache/fbr_{season}_{data_type}.json').expanduser()
+    
+    def _read_cache(self, season, data_type):
+        """Load a cached response entry, or None if missing or unreadable"""
+        try:
+            with open(self._cache_path(season, data_type), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cache(self, season, data_type, data, etag=None, last_modified=None):
+        """Store a response with its validators; a failed write only costs the cache"""
+        cache_path = self._cache_path(season, data_type)
+        entry = {'fetched_at': time.time(), 'etag': etag, 'last_modified': last_modified, 'data': data}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w') as f:
+                json.dump(entry, f)
+        except OSError as e:
+            print(f"⚠ Could not cache {data_type}: {e}")
+    
+    def _processed_cache_paths(self, season):
+        """On-disk locations of the cleaned player and team tables"""
+        cache_dir = Path('~/.fpl_cache').expanduser()
+        return cache_dir / f'players_{season}.parquet', cache_dir / f'teams_{season}.parquet'
+    
+    def _load_processed_cache(self, season):
+        """Restore cleaned tables saved within the TTL; False if absent, stale or unreadable"""
+        if not _HAS_PYARROW:
+            return False
+        players_path, teams_path = self._processed_cache_paths(season)
+        try:
+            if time.time() - players_path.stat().st_mtime >= _CACHE_TTL_SECONDS:
+                return False
+            # Parquet reads Arrow strings back as StringDtype, so reapply the in-memory dtypes
+            players = self._compact_dtypes(pd.read_parquet(players_path))
+            teams = pd.read_parquet(teams_path)
+        except (OSError, ValueError):
+            return False
+        
+        self._data_version += 1
+        self.players_data = players
+        self.team_data = teams
+        if not players.empty:
+            self._set_stat_matrix(players)
+        return True
+    
+    def _write_processed_cache(self, season):
+        """Save the cleaned tables as zstd Parquet; a failed write only costs the warm start"""
+        if not _HAS_PYARROW:
+            return
+        players_path, teams_path = self._processed_cache_paths(season)
+        try:
+            players_path.parent.mkdir(parents=True, exist_ok=True)
+            # Players last, so its timestamp never vouches for a missing teams file
+            self.team_data.to_parquet(teams_path, compression='zstd')
+            self.players_data.to_parquet(players_path, compression='zstd')
+        except (OSError, ValueError, TypeError) as e:
+            print(f"⚠ Could not cache processed data: {e}")
+    
+    def _revalidation_headers(self, entry):
+        """Conditional-request headers for a stale cache entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
     def _get_sample_data(self, data_type):
         """Return sample data when API is unavailable"""
         if data_type == 'players':
-            return {
-                'players': [
-                    {
-                        'name': 'Mohamed Salah', 'team': 'Liverpool', 'position': 'FW',
-                        'goals': 24, 'assists': 13, 'apps': 34, 'mins': 3060,
-                        'shots_on_target': 89, 'key_passes': 86, 'successful_dribbles': 45,
-                        'yellow_cards': 2, 'red_cards': 0, 'clean_sheets': 18
-                    },
-                    {
-                        'name': 'Bruno Fernandes', 'team': 'Manchester United', 'position': 'MF',
-                        'goals': 8, 'assists': 15, 'apps': 32, 'mins': 2880,
-                        'shots_on_target': 45, 'key_passes': 102, 'tackles_won': 45,
-                        'yellow_cards': 5, 'red_cards': 0, 'clean_sheets': 12
-                    },
-                    {
-                        'name': 'Virgil van Dijk', 'team': 'Liverpool', 'position': 'DF',
-                        'goals': 2, 'assists': 3, 'apps': 35, 'mins': 3150,
-                        'tackles_won': 67, 'interceptions': 89, 'aerials_won': 156,
-                        'yellow_cards': 1, 'red_cards': 0, 'clean_sheets': 18
-                    },
-                    {
-                        'name': 'Alisson', 'team': 'Liverpool', 'position': 'GK',
-                        'goals': 0, 'assists': 1, 'apps': 36, 'mins': 3240,
-                        'saves': 89, 'clean_sheets': 18, 'goals_conceded': 28,
-                        'yellow_cards': 0, 'red_cards': 0, 'penalty_saves': 2
-                    }
-                ]
-            }
+            players = [
+                {
+                    'name': 'Mohamed Salah', 'team': 'Liverpool', 'position': 'FW',
+                    'goals': 24, 'assists': 13, 'apps': 34, 'mins': 3060,
+                    'shots_on_target': 89, 'key_passes': 86, 'successful_dribbles': 45,
+                    'yellow_cards': 2, 'red_cards': 0, 'clean_sheets': 18
+                },
+                {
+                    'name': 'Bruno Fernandes', 'team': 'Manchester United', 'position': 'MF',
+                    'goals': 8, 'assists': 15, 'apps': 32, 'mins': 2880,
+                    'shots_on_target': 45, 'key_passes': 102, 'tackles_won': 45,
+                    'yellow_cards': 5, 'red_cards': 0, 'clean_sheets': 12
+                },
+                {
+                    'name': 'Virgil van Dijk', 'team': 'Liverpool', 'position': 'DF',
+                    'goals': 2, 'assists': 3, 'apps': 35, 'mins': 3150,
+                    'tackles_won': 67, 'interceptions': 89, 'aerials_won': 156,
+                    'yellow_cards': 1, 'red_cards': 0, 'clean_sheets': 18
+                },
+                {
+                    'name': 'Alisson', 'team': 'Liverpool', 'position': 'GK',
+                    'goals': 0, 'assists': 1, 'apps': 36, 'mins': 3240,
+                    'saves': 89, 'clean_sheets': 18, 'goals_conceded': 28,
+                    'yellow_cards': 0, 'red_cards': 0, 'penalty_saves': 2
+                }
+            ]
+            # Typed records give the DataFrame numeric columns up front, so cleaning skips coercion
+            records = [tuple(player.get(field, np.nan) for field in PLAYER_DTYPE.names) for player in players]
+            return {'players': np.array(records, dtype=PLAYER_DTYPE)}
         elif data_type == 'teams':
             return {
                 'teams': [
@@ -156,10 +401,12 @@ class PreDraftAnalyzer:
     
     def _process_api_data(self, api_data):
         """Process and clean the API data"""
+        self._data_version += 1
         if 'players' in api_data:
-            self.players_data = pd.DataFrame(api_data['players'].get('players', []))
+            self.players_data = pd.DataFrame.from_records(api_data['players'].get('players', []))
             if not self.players_data.empty:
-                self.players_data = self._clean_player_data(self.players_data)
+                self.players_data = self._compact_dtypes(self._clean_player_data(self.players_data))
+                self._set_stat_matrix(self.players_data)
         
         if 'teams' in api_data:
             self.team_data = pd.DataFrame(api_data['teams'].get('teams', []))
@@ -170,18 +417,79 @@ class PreDraftAnalyzer:
         numeric_cols = ['goals', 'assists', 'apps', 'mins', 'shots_on_target', 
                        'key_passes', 'yellow_cards', 'red_cards']
         
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-        
-        # Add derived metrics
-        df['goals_per_90'] = (df['goals'] * 90) / df['mins'].replace(0, 1)
-        df['assists_per_90'] = (df['assists'] * 90) / df['mins'].replace(0, 1)
-        df['goal_contributions'] = df['goals'] + df['assists']
-        df['gc_per_90'] = (df['goal_contributions'] * 90) / df['mins'].replace(0, 1)
+        present_cols = [col for col in numeric_cols if col in df.columns]
+        coerce_cols = [col for col in present_cols if not pd.api.types.is_numeric_dtype(df[col])]
+        if coerce_cols:
+            df[coerce_cols] = df[coerce_cols].apply(pd.to_numeric, errors='coerce')
+        df[present_cols] = df[present_cols].fillna(0)
+        
+        # Add derived metrics, sharing one 90/mins factor (0 for players with no minutes)
+        mins = df['mins'].to_numpy(dtype=np.float64)
+        inv90 = np.divide(90.0, mins, out=np.zeros_like(mins), where=mins > 0)
+        g = df['goals'].to_numpy()
+        a = df['assists'].to_numpy()
+        df['goals_per_90'] = g * inv90
+        df['assists_per_90'] = a * inv90
+        df['goal_contributions'] = g + a
+        df['gc_per_90'] = (g + a) * inv90
+        
+        # Integer-coded position/team; unexpected values are appended rather than dropped
+        df['position'] = self._as_category(df['position'], ['FW', 'MF', 'DF', 'GK'])
+        df['team'] = self._as_category(df['team'], self.premier_league_teams)
         
         return df
     
+    def _compact_dtypes(self, df):
+        """Downcast float stats to float32 and store free-text columns as Arrow strings"""
+        float_cols = df.select_dtypes('float').columns
+        df[float_cols] = df[float_cols].astype(np.float32)
+        if _HAS_PYARROW:
+            str_cols = df.select_dtypes(include=['object', 'string']).columns
+            df[str_cols] = df[str_cols].astype(pd.ArrowDtype(pa.string()))
+        return df
+    
+    def _build_stat_matrix(self, df):
+        """
+        float32 matrix over the canonical stat columns, plus a mask of its missing cells
+        
+        Absent columns and NaN/inf cells are stored as 0 so weighted sums need no
+        guards; the mask lets averages and thresholds still skip missing values.
+        """
+        X = df.reindex(columns=self._stat_columns, fill_value=0).to_numpy(dtype=np.float32)
+        missing = np.isnan(X)
+        np.nan_to_num(X, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        return X, missing
+    
+    def _set_stat_matrix(self, df):
+        """Build the stat matrix and its per-load derivatives for the current player table"""
+        self._X, self._missing = self._build_stat_matrix(df)
+        self._X_source = df
+        # Games divisor for per-game projections, floored at 1 so no call needs a zero guard
+        self._safe_apps = np.maximum(self._X[:, self._col_index['apps']].astype(np.float64), 1.0)
+    
+    def _sync_stat_matrix(self):
+        """Rebuild the matrix and invalidate memoized results if players_data was replaced"""
+        df = self.players_data
+        if self._X is None or df is not self._X_source or len(df) != len(self._X):
+            self._set_stat_matrix(df)
+            self._data_version += 1
+    
+    def _stat_column(self, name, rows):
+        """One stat for the given rows as float64, with missing cells restored as NaN"""
+        i = self._col_index[name]
+        return np.where(self._missing[rows, i], np.nan, self._X[rows, i].astype(np.float64))
+    
+    def _round_for_display(self, df):
+        """Round to 2 dp in float64 so float32 stats don't print or serialize with float noise"""
+        float_cols = df.select_dtypes('float').columns
+        return df.astype({col: np.float64 for col in float_cols}).round(2)
+    
+    def _as_category(self, values, categories):
+        """Cast to a categorical with the given categories first, then any extras seen"""
+        known = set(categories)
+        extras = [value for value in pd.unique(values.dropna()) if value not in known]
+        return values.astype(pd.CategoricalDtype(categories=list(categories) + extras))
+    
     def calculate_fpl_scores(self):
         """Calculate FPL scores for all players"""
         if self.players_data is None or self.players_data.empty:
@@ -190,24 +498,27 @@ class PreDraftAnalyzer:
         
         print("Calculating FPL scores...")
         
-        def calc_score(row):
-            pos = row['position']
-            if pos not in self.position_weights:
-                return 0
-            
-            weights = self.position_weights[pos]
-            score = 0
-            
-            for stat, weight in weights.items():
-                if stat in row and pd.notna(row[stat]):
-                    score += row[stat] * weight
+        self._sync_stat_matrix()
+        df = self.players_data
+        
+        # Weighted stats straight from the shared matrix
+        X = self._X[:, self._weight_idx]
+        
+        if _HAS_NUMBA and len(df) > _JIT_MIN_ROWS:
+            # Codes against the weight table's rows whatever position's dtype; unknown (-1) scores 0
+            pos = pd.Categorical(df['position'], categories=self.weight_matrix.index).codes.astype(np.int8)
+            scores = _score_all(X, self._safe_apps, self.weight_matrix.to_numpy(), pos)
+        else:
+            # One weight row per player; unknown positions and missing/NaN stats score 0
+            W = self.weight_matrix.reindex(df['position']).fillna(0).to_numpy()
+            raw = (X * W).sum(axis=1, dtype=np.float64)
             
-            # Normalize to per-game basis
-            games = max(row.get('apps', 1), 1)
-            return score / games * 38  # Project to full season
+            # Normalize to per-game basis and project to a full season
+            scores = raw / self._safe_apps * 38
         
-        self.players_data['fpl_score'] = self.players_data.apply(calc_score, axis=1)
+        self.players_data['fpl_score'] = pd.Series(scores, index=df.index)
         self.players_data['fpl_score_per_game'] = self.players_data['fpl_score'] / 38
+        self._data_version += 1
     
     def generate_position_rankings(self, top_n=25):
         """Generate top N rankings by position"""
@@ -215,18 +526,27 @@ class PreDraftAnalyzer:
             print("No data available for rankings")
             return {}
         
+        self._sync_stat_matrix()
+        # Hand out copies so callers can't edit the memoized frames
+        rankings = self._rankings_cached(self._data_version, top_n)
+        return {pos: players.copy() for pos, players in rankings.items()}
+    
+    def _compute_position_rankings(self, data_version, top_n):
+        """Build the rankings; data_version only keys the cache"""
         print(f"Generating top {top_n} rankings by position...")
         
         rankings = {}
         positions = ['FW', 'MF', 'DF', 'GK']
         
+        # One global sort by FPL score, then the top N of each position
+        sorted_df = self.players_data.sort_values('fpl_score', ascending=False, kind='stable')
+        top = sorted_df.groupby('position', sort=False, observed=True).head(top_n)
+        top_by_position = {pos: group for pos, group in top.groupby('position', sort=False, observed=True)}
+        
         for pos in positions:
-            pos_data = self.players_data[self.players_data['position'] == pos].copy()
-            if pos_data.empty:
+            pos_data = top_by_position.get(pos)
+            if pos_data is None or pos_data.empty:
                 continue
-                
-            # Sort by FPL score
-            pos_data = pos_data.nlargest(top_n, 'fpl_score')
             
             # Select relevant columns
             display_cols = ['name', 'team', 'goals', 'assists', 'apps', 'fpl_score', 'goals_per_90', 'assists_per_90']
@@ -237,7 +557,7 @@ class PreDraftAnalyzer:
             
             # Filter to available columns
             available_cols = [col for col in display_cols if col in pos_data.columns]
-            rankings[pos] = pos_data[available_cols].round(2)
+            rankings[pos] = self._round_for_display(pos_data[available_cols])
         
         return rankings
     
@@ -246,51 +566,66 @@ class PreDraftAnalyzer:
         if self.players_data is None:
             return {}
         
+        self._sync_stat_matrix()
+        value_picks = self._value_picks_cached(self._data_version, min_apps)
+        return {pos: players.copy() for pos, players in value_picks.items()}
+    
+    def _compute_value_picks(self, data_version, min_apps):
+        """Build the value picks; data_version only keys the cache"""
         print("Identifying value picks and sleepers...")
         
         # Filter players with minimum appearances
-        eligible = self.players_data[self.players_data['apps'] >= min_apps].copy()
+        col = self._col_index
+        is_eligible = self._X[:, col['apps']] >= min_apps
+        eligible = self.players_data[is_eligible].copy()
         
         value_picks = {}
+        if eligible.empty:
+            return value_picks
+        
+        X = self._X[is_eligible]
+        position = eligible['position']
+        is_attacker = position.isin(['FW', 'MF']).to_numpy()
+        cs = self._stat_column('clean_sheets', is_eligible)
+        saves = self._stat_column('saves', is_eligible)
+        
+        # Find players with good per-game metrics but maybe lower total scores:
+        # FW/MF by goal contribution per 90, DF by clean sheets and goal contributions,
+        # GK by clean sheets and saves
+        eligible['value_metric'] = np.select(
+            [is_attacker, (position == 'DF').to_numpy(), (position == 'GK').to_numpy()],
+            [X[:, col['gc_per_90']], cs * 2 + X[:, col['goal_contributions']], cs + saves * 0.1],
+            default=np.nan
+        )
+        
+        # Top 30% of the metric for FW/MF, top 40% for DF/GK, excluding the top 20% by FPL score
+        grouped = eligible.groupby('position', observed=True)
+        threshold = np.where(is_attacker,
+                             grouped['value_metric'].transform('quantile', 0.7),
+                             grouped['value_metric'].transform('quantile', 0.6))
+        fpl_threshold = grouped['fpl_score'].transform('quantile', 0.8)
+        
+        # Lowest FPL scores among good metric players, five per position
+        value_candidates = eligible[(eligible['value_metric'] >= threshold) &
+                                    (eligible['fpl_score'] < fpl_threshold)]
+        value_candidates = value_candidates.sort_values('fpl_score', kind='stable')
+        value_candidates = value_candidates.groupby('position', observed=True).head(5)
         
         for pos in ['FW', 'MF', 'DF', 'GK']:
-            pos_data = eligible[eligible['position'] == pos].copy()
-            if pos_data.empty:
+            pos_candidates = value_candidates[value_candidates['position'] == pos]
+            if pos_candidates.empty:
                 continue
             
-            # Find players with good per-game metrics but maybe lower total scores
+            display_cols = ['name', 'team', 'apps', 'value_metric', 'fpl_score']
             if pos in ['FW', 'MF']:
-                # Look for high goal contribution per 90
-                pos_data['value_metric'] = pos_data['gc_per_90']
-                threshold = pos_data['value_metric'].quantile(0.7)  # Top 30%
+                display_cols.extend(['goals', 'assists', 'gc_per_90'])
             elif pos == 'DF':
-                # Defenders: combine clean sheets and goal contributions
-                pos_data['value_metric'] = (pos_data.get('clean_sheets', 0) * 2 + 
-                                          pos_data['goal_contributions'])
-                threshold = pos_data['value_metric'].quantile(0.6)
-            else:  # GK
-                pos_data['value_metric'] = pos_data.get('clean_sheets', 0) + pos_data.get('saves', 0) * 0.1
-                threshold = pos_data['value_metric'].quantile(0.6)
-            
-            # Find value picks: good metrics but not in top FPL scores
-            fpl_threshold = pos_data['fpl_score'].quantile(0.8)  # Top 20% by FPL score
-            
-            value_candidates = pos_data[
-                (pos_data['value_metric'] >= threshold) & 
-                (pos_data['fpl_score'] < fpl_threshold)
-            ].nsmallest(10, 'fpl_score')  # Lowest FPL scores among good metric players
+                display_cols.extend(['goals', 'assists', 'clean_sheets'])
+            else:
+                display_cols.extend(['clean_sheets', 'saves'])
             
-            if not value_candidates.empty:
-                display_cols = ['name', 'team', 'apps', 'value_metric', 'fpl_score']
-                if pos in ['FW', 'MF']:
-                    display_cols.extend(['goals', 'assists', 'gc_per_90'])
-                elif pos == 'DF':
-                    display_cols.extend(['goals', 'assists', 'clean_sheets'])
-                else:
-                    display_cols.extend(['clean_sheets', 'saves'])
-                
-                available_cols = [col for col in display_cols if col in value_candidates.columns]
-                value_picks[pos] = value_candidates[available_cols].head(5).round(2)
+            available_cols = [col for col in display_cols if col in pos_candidates.columns]
+            value_picks[pos] = self._round_for_display(pos_candidates[available_cols])
         
         return value_picks
     
@@ -299,38 +634,50 @@ class PreDraftAnalyzer:
         if self.players_data is None:
             return {}
         
+        self._sync_stat_matrix()
+        return {team: dict(stats) for team, stats in self._team_stats_cached(self._data_version).items()}
+    
+    def _compute_team_analysis(self, data_version):
+        """Build the team stats; data_version only keys the cache"""
         print("Analyzing teams...")
         
-        team_stats = {}
-        
-        for team in self.premier_league_teams:
-            team_players = self.players_data[self.players_data['team'] == team]
-            if team_players.empty:
-                continue
-            
-            # Defensive metrics
-            defenders = team_players[team_players['position'] == 'DF']
-            goalkeepers = team_players[team_players['position'] == 'GK']
-            
-            avg_clean_sheets = 0
-            if not defenders.empty or not goalkeepers.empty:
-                all_defensive = pd.concat([defenders, goalkeepers])
-                avg_clean_sheets = all_defensive.get('clean_sheets', pd.Series([0])).mean()
-            
-            # Attacking metrics
-            attackers = team_players[team_players['position'].isin(['FW', 'MF'])]
-            total_goals = attackers['goals'].sum() if not attackers.empty else 0
-            total_assists = attackers['assists'].sum() if not attackers.empty else 0
-            
-            team_stats[team] = {
-                'avg_clean_sheets': round(avg_clean_sheets, 1),
-                'total_goals': int(total_goals),
-                'total_assists': int(total_assists),
-                'attack_strength': round((total_goals + total_assists) / len(attackers) if len(attackers) > 0 else 0, 1),
-                'defensive_rating': 'High' if avg_clean_sheets > 15 else 'Medium' if avg_clean_sheets > 10 else 'Low'
-            }
-        
-        return team_stats
+        df = self.players_data
+        X, col = self._X, self._col_index
+        team = df['team']
+        team_sizes = team.groupby(team, observed=True).size()
+        teams = pd.Index([name for name in self.premier_league_teams if team_sizes.get(name, 0) > 0])
+        
+        # Defensive metrics: mean clean sheets over each team's DF + GK (0 if it has none)
+        is_def = df['position'].isin(['DF', 'GK']).to_numpy()
+        def_cs = pd.Series(self._stat_column('clean_sheets', is_def), index=df.index[is_def])
+        def_cs = def_cs.groupby(team[is_def], observed=True).mean()
+        avg_clean_sheets = def_cs.reindex(teams).where(teams.isin(def_cs.index), 0)
+        
+        # Attacking metrics: goal/assist totals over each team's FW + MF
+        is_atk = df['position'].isin(['FW', 'MF']).to_numpy()
+        attackers = pd.DataFrame({'goals': X[is_atk, col['goals']], 'assists': X[is_atk, col['assists']]},
+                                 index=df.index[is_atk])
+        atk = attackers.groupby(team[is_atk], observed=True).agg(
+            goals=('goals', 'sum'), assists=('assists', 'sum'), n=('goals', 'size'))
+        atk = atk.reindex(teams, fill_value=0)
+        contributions = (atk['goals'] + atk['assists']).to_numpy(dtype=np.float64)
+        n_attackers = atk['n'].to_numpy()
+        attack_strength = np.divide(contributions, n_attackers, out=np.zeros_like(contributions),
+                                    where=n_attackers > 0)
+        
+        # Rating buckets in one pass; a team with no recorded clean sheets (NaN) rates Low
+        cs = avg_clean_sheets.to_numpy()
+        defensive_rating = np.select([cs > 15, cs > 10], ['High', 'Medium'], default='Low')
+        
+        team_stats = pd.DataFrame({
+            'avg_clean_sheets': avg_clean_sheets.round(1),
+            'total_goals': atk['goals'].astype(np.int64),
+            'total_assists': atk['assists'].astype(np.int64),
+            'attack_strength': np.round(attack_strength, 1),
+            'defensive_rating': defensive_rating
+        }, index=teams)
+        
+        return team_stats.to_dict('index')
     
     def generate_draft_cheat_sheet(self):
         """Generate a comprehensive draft cheat sheet"""
@@ -341,26 +688,7 @@ class PreDraftAnalyzer:
             'top_players_by_position': self.generate_position_rankings(25),
             'value_picks': self.identify_value_picks(),
             'team_analysis': self.team_analysis(),
-            'draft_strategy': {
-                'rounds_1_3': [
-                    "Target elite midfielders (Bruno, KDB, Saka)",
-                    "Consider premium forwards (Haaland, Salah)",
-                    "Avoid goalkeepers - wait until round 6+",
-                    "Look for players with penalty duties"
-                ],
-                'rounds_4_6': [
-                    "Fill midfielder positions with consistent scorers",
-                    "Target defenders from top defensive teams",
-                    "Consider your first goalkeeper here",
-                    "Look for players with multiple category contributions"
-                ],
-                'rounds_7_plus': [
-                    "Focus on upside picks and breakout candidates",
-                    "Target newly promoted team standouts",
-                    "Consider injury-prone players with high ceilings",
-                    "Fill bench with players who could surprise"
-                ]
-            }
+            'draft_strategy': _DRAFT_STRATEGY
         }
         
         return cheat_sheet
@@ -372,53 +700,46 @@ class PreDraftAnalyzer:
         
         # Save as JSON
         json_file = f"{filename}.json"
-        with open(json_file, 'w') as f:
-            # Convert DataFrames to dict for JSON serialization
-            json_data = {}
-            for key, value in cheat_sheet.items():
-                if isinstance(value, dict):
-                    json_data[key] = {}
-                    for k, v in value.items():
-                        if isinstance(v, pd.DataFrame):
-                            json_data[key][k] = v.to_dict('records')
-                        else:
-                            json_data[key][k] = v
-                else:
-                    json_data[key] = value
-            
-            json.dump(json_data, f, indent=2, default=str)
+        # DataFrames are converted to records by the encoder's default hook
+        if _HAS_ORJSON:
+            with open(json_file, 'wb') as f:
+                f.write(orjson.dumps(cheat_sheet, default=_json_default,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(json_file, 'w') as f:
+                json.dump(cheat_sheet, f, indent=2, default=_json_default)
         
         print(f"Analysis saved to: {json_file}")
         
         # Save readable text summary
         txt_file = f"{filename}.txt"
-        with open(txt_file, 'w') as f:
-            f.write(f"FPL Draft Analysis - {cheat_sheet['timestamp']}\n")
-            f.write("=" * 60 + "\n\n")
-            
-            # Top players by position
-            f.write("TOP PLAYERS BY POSITION\n")
-            f.write("-" * 30 + "\n")
-            for pos, players in cheat_sheet['top_players_by_position'].items():
-                f.write(f"\n{pos} - Top 10:\n")
-                f.write(players.head(10).to_string(index=False))
-                f.write("\n")
-            
-            # Value picks
-            f.write("\nVALUE PICKS & SLEEPERS\n")
-            f.write("-" * 30 + "\n")
-            for pos, players in cheat_sheet['value_picks'].items():
-                f.write(f"\n{pos} Value Picks:\n")
-                f.write(players.to_string(index=False))
-                f.write("\n")
-            
-            # Team analysis
-            f.write("\nTEAM ANALYSIS\n")
-            f.write("-" * 30 + "\n")
-            for team, stats in cheat_sheet['team_analysis'].items():
-                f.write(f"{team}: Clean Sheets: {stats['avg_clean_sheets']}, "
-                       f"Goals+Assists: {stats['total_goals']+stats['total_assists']}, "
-                       f"Defense: {stats['defensive_rating']}\n")
+        parts = [f"FPL Draft Analysis - {cheat_sheet['timestamp']}\n", "=" * 60 + "\n\n"]
+        
+        # Tables are tab-separated via the C CSV writer; its output already ends each row with a newline
+        table_opts = dict(sep='\t', index=False, float_format='%.2f', lineterminator='\n')
+        
+        # Top players by position
+        parts.append("TOP PLAYERS BY POSITION\n")
+        parts.append("-" * 30 + "\n")
+        for pos, players in cheat_sheet['top_players_by_position'].items():
+            parts.append(f"\n{pos} - Top 10:\n{players.head(10).to_csv(**table_opts)}")
+        
+        # Value picks
+        parts.append("\nVALUE PICKS & SLEEPERS\n")
+        parts.append("-" * 30 + "\n")
+        for pos, players in cheat_sheet['value_picks'].items():
+            parts.append(f"\n{pos} Value Picks:\n{players.to_csv(**table_opts)}")
+        
+        # Team analysis
+        parts.append("\nTEAM ANALYSIS\n")
+        parts.append("-" * 30 + "\n")
+        for team, stats in cheat_sheet['team_analysis'].items():
+            parts.append(f"{team}: Clean Sheets: {stats['avg_clean_sheets']}, "
+                         f"Goals+Assists: {stats['total_goals']+stats['total_assists']}, "
+                         f"Defense: {stats['defensive_rating']}\n")
+        
+        # One write for the whole report
+        Path(txt_file).write_text("".join(parts))
         
         print(f"Summary saved to: {txt_file}")
 
@@ -451,8 +772,8 @@ def main():
             if pos in cheat_sheet['top_players_by_position']:
                 top_5 = cheat_sheet['top_players_by_position'][pos].head(5)
                 print(f"\nTop 5 {pos}:")
-                for idx, row in top_5.iterrows():
-                    print(f"  {row['name']} ({row['team']}) - {row.get('fpl_score', 'N/A'):.1f}")
+                for row in top_5.itertuples(index=False):
+                    print(f"  {row.name} ({row.team}) - {getattr(row, 'fpl_score', float('nan')):.1f}")
     
     # Save analysis
     print("\n5. Saving analysis...")